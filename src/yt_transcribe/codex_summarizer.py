@@ -2,26 +2,29 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Iterator, Optional
 
 CODEX_CMD = ["bunx", "@openai/codex@latest"]
 CODEX_AUTH_FILES = ("auth.json", "config.toml", "config.json")
+STREAM_BLOCK_SIZE = 64 * 1024
+STDERR_TAIL_SIZE = 8 * 1024
 
 
 def summarize_with_codex(
-    transcription: str,
+    transcription_path: Path,
     prompt: str,
     state_dir: Path,
     model: Optional[str] = None,
 ) -> str:
-    """Summarize transcription using the Codex CLI.
+    """Summarize a transcription file using the Codex CLI.
 
     Args:
-        transcription: The text to summarize.
+        transcription_path: UTF-8 text file with the transcript to summarize.
         prompt: The summarization prompt.
         state_dir: Directory for Codex output artifacts.
         model: Optional model name override (CODEX_MODEL env var if unset, defaults to gpt-5.2-codex).
@@ -35,9 +38,10 @@ def summarize_with_codex(
         model = os.getenv("CODEX_MODEL", "gpt-5.2-codex")
 
     output_path = state_dir / "codex_summary.txt"
-    if output_path.exists():
-        output_path.unlink()
-    full_prompt = _build_prompt(transcription, prompt)
+    stderr_path = state_dir / "codex_stderr.log"
+    # Truncate (or create) rather than stat + unlink: an empty file afterwards
+    # means Codex did not produce a summary on this run.
+    output_path.write_bytes(b"")
 
     cmd = CODEX_CMD + [
         "exec",
@@ -53,40 +57,102 @@ def summarize_with_codex(
 
     cmd.append("-")
 
-    result = subprocess.run(
-        cmd,
-        input=full_prompt,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        stderr = result.stderr.strip()
-        stdout = result.stdout.strip()
-        details = stderr or stdout or "No error output captured."
+    # The transcript is opened before Codex starts, so a missing file fails
+    # without spawning anything. The summary is read from
+    # --output-last-message, so stdout is discarded and stderr goes to a file
+    # (kept only for error reporting). A file rather than a pipe means Codex
+    # can never block on a full stderr pipe while we are still writing the
+    # prompt.
+    with open(transcription_path, "rb") as transcript:
+        with open(stderr_path, "wb") as stderr_file, subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+        ) as proc:
+            try:
+                _write_stdin(proc, _iter_prompt_chunks(transcript, prompt))
+            except BaseException:
+                # Never leave Codex running on a partial prompt (as
+                # subprocess.run would not): kill and reap it, then re-raise.
+                proc.kill()
+                proc.wait()
+                # Discard buffered input so closing stdin can't mask the error
+                with contextlib.suppress(OSError):
+                    proc.stdin.close()
+                raise
+            returncode = proc.wait()
+
+    if returncode != 0:
+        details = _read_tail(stderr_path, STDERR_TAIL_SIZE).strip()
+        details = details or "No error output captured."
         raise RuntimeError(f"Codex CLI summarization failed: {details}")
 
-    if not output_path.exists():
-        raise RuntimeError("Codex CLI did not write a summary output file.")
-
-    summary = output_path.read_text().strip()
+    try:
+        summary = output_path.read_bytes().decode("utf-8").strip()
+    except FileNotFoundError:
+        raise RuntimeError("Codex CLI did not write a summary output file.") from None
     if not summary:
         raise RuntimeError("Codex CLI returned an empty summary.")
 
     return summary
 
 
-def _build_prompt(transcription: str, prompt: str) -> str:
-    """Build the Codex prompt for summarization."""
-    return (
+def _build_prompt(prompt: str) -> tuple[bytes, bytes]:
+    """Build the Codex prompt that surrounds the transcript.
+
+    Returns:
+        The (head, tail) bytes to write before and after the transcript.
+    """
+    head = (
         "You are a financial analyst helping investors extract actionable insights from content.\n"
         "Follow the format exactly and keep the response concise.\n"
         f"{prompt}\n\n"
         "Transcript:\n"
-        f"{transcription}\n\n"
+    )
+    tail = (
+        "\n\n"
         "Return only the summary in markdown. Do not include the transcript, code fences, or extra commentary."
     )
+    return head.encode("utf-8"), tail.encode("utf-8")
+
+
+def _iter_prompt_chunks(transcript: BinaryIO, prompt: str) -> Iterator[bytes]:
+    """Yield the full Codex prompt as UTF-8 chunks.
+
+    The transcript is streamed from the open file one block at a time so it
+    is never held in memory as part of the prompt.
+    """
+    head, tail = _build_prompt(prompt)
+    yield head
+    while block := transcript.read(STREAM_BLOCK_SIZE):
+        yield block
+    yield tail
+
+
+def _write_stdin(proc: subprocess.Popen, chunks: Iterable[bytes]) -> None:
+    """Write chunks to the process's stdin and close it."""
+    # A BrokenPipeError means Codex exited before reading all input; its
+    # exit status and stderr explain why, so the caller reports that instead.
+    try:
+        for chunk in chunks:
+            proc.stdin.write(chunk)
+    except BrokenPipeError:
+        pass
+    try:
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+
+
+def _read_tail(path: Path, limit: int) -> str:
+    """Read at most the last `limit` bytes of a file as text."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - limit))
+        data = f.read()
+    return data.decode("utf-8", errors="replace")
 
 
 def _ensure_codex_ready() -> None:
@@ -1,5 +1,6 @@
 """Configuration and constants for yt-transcribe."""
 
+import functools
 import os
 import platform
 import sys
@@ -32,8 +33,10 @@ def load_config() -> dict:
     return {}
 
 
-# Load config at module import
-_config = load_config()
+@functools.cache
+def _get_config() -> dict:
+    """Load configuration once per process."""
+    return load_config()
 
 
 def get_telegram_token() -> Optional[str]:
@@ -42,7 +45,7 @@ def get_telegram_token() -> Optional[str]:
     env_token = os.environ.get("TELEGRAM_BOT_TOKEN")
     if env_token:
         return env_token
-    return _config.get("telegram", {}).get("token")
+    return _get_config().get("telegram", {}).get("token")
 
 
 def get_telegram_chat_id() -> Optional[str]:
@@ -50,7 +53,7 @@ def get_telegram_chat_id() -> Optional[str]:
     env_chat_id = os.environ.get("TELEGRAM_CHAT_ID")
     if env_chat_id:
         return env_chat_id
-    return _config.get("telegram", {}).get("chat_id")
+    return _get_config().get("telegram", {}).get("chat_id")
 
 
 def get_email_recipient() -> Optional[str]:
@@ -58,7 +61,7 @@ def get_email_recipient() -> Optional[str]:
     env_recipient = os.environ.get("EMAIL_RECIPIENT")
     if env_recipient:
         return env_recipient
-    return _config.get("email", {}).get("recipient")
+    return _get_config().get("email", {}).get("recipient")
 
 
 def get_email_sender() -> Optional[str]:
@@ -66,7 +69,7 @@ def get_email_sender() -> Optional[str]:
     env_sender = os.environ.get("EMAIL_SENDER")
     if env_sender:
         return env_sender
-    return _config.get("email", {}).get("sender")
+    return _get_config().get("email", {}).get("sender")
 
 
 def get_prompt_path() -> Path:
@@ -113,16 +116,20 @@ WHISPER_MODEL = "mlx-community/whisper-large-v3-turbo"
 TELEGRAM_CHAR_LIMIT = 4096
 
 
-# Check if running on Apple Silicon
+# Platform is fixed for the life of the process, so probe it once at import
+_PLATFORM = (platform.system(), platform.machine())
+_IS_APPLE_SILICON = _PLATFORM == ("Darwin", "arm64")
+
+
 def is_apple_silicon() -> bool:
     """Check if running on Apple Silicon Mac."""
-    return platform.system() == "Darwin" and platform.machine() == "arm64"
+    return _IS_APPLE_SILICON
 
 
 def check_platform():
     """Verify platform requirements."""
-    if not is_apple_silicon():
+    if not _IS_APPLE_SILICON:
         raise RuntimeError(
             "yt-transcribe requires Apple Silicon (M-series) Mac.\n"
-            f"Detected: {platform.system()} {platform.machine()}"
+            f"Detected: {_PLATFORM[0]} {_PLATFORM[1]}"
         )
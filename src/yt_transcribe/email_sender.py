@@ -1,5 +1,6 @@
 """Email sender using macOS local MTA (sendmail)."""
 
+import functools
 import os
 import shutil
 import subprocess
@@ -7,8 +8,6 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Optional
 
-import markdown
-
 from .config import get_email_recipient, get_email_sender
 
 
@@ -102,24 +101,9 @@ EMAIL_CSS = """
 """
 
 
-def markdown_to_html(markdown_text: str) -> str:
-    """
-    Convert markdown to email-friendly HTML with inline styling.
-
-    Args:
-        markdown_text: Markdown content
-
-    Returns:
-        HTML string with inline CSS
-    """
-    # Convert markdown to HTML
-    html_content = markdown.markdown(
-        markdown_text,
-        extensions=['extra', 'nl2br', 'sane_lists']
-    )
-
-    # Wrap in styled container
-    full_html = f"""
+# Page wrapper around the converted markdown, built once with the CSS inlined.
+# Kept as str rather than bytes: MIMEText only accepts str payloads.
+_HTML_PREFIX = f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -129,13 +113,52 @@ def markdown_to_html(markdown_text: str) -> str:
 </head>
 <body>
     <div class="content">
-        {html_content}
+        """
+
+_HTML_SUFFIX = """
     </div>
 </body>
 </html>
 """
 
-    return full_html
+
+@functools.cache
+def _get_markdown_converter():
+    """Build the markdown converter once; extension loading is costly."""
+    import markdown
+
+    return markdown.Markdown(
+        extensions=['extra', 'nl2br', 'sane_lists'],
+        output_format='html5',
+    )
+
+
+def markdown_to_html(markdown_text: str) -> str:
+    """
+    Convert markdown to email-friendly HTML with inline styling.
+
+    Args:
+        markdown_text: Markdown content
+
+    Returns:
+        HTML string with inline CSS
+    """
+    # Convert markdown to HTML (reset clears state from any previous document)
+    html_content = _get_markdown_converter().reset().convert(markdown_text)
+
+    # Wrap in styled container
+    return _HTML_PREFIX + html_content + _HTML_SUFFIX
+
+
+def _wants_html(recipient: str) -> bool:
+    """Whether to include an HTML part for this recipient.
+
+    Local mailboxes (user@localhost) are typically read with tools that
+    don't render HTML, and YT_TRANSCRIBE_PLAIN_EMAIL=1 forces plain text.
+    """
+    if os.getenv("YT_TRANSCRIBE_PLAIN_EMAIL", "").strip().lower() in ("1", "true", "yes"):
+        return False
+    return not recipient.lower().endswith("@localhost")
 
 
 def send_email(
@@ -156,6 +179,7 @@ def send_email(
     Environment variables:
         EMAIL_RECIPIENT: Default recipient email address
         EMAIL_SENDER: Default sender email address
+        YT_TRANSCRIBE_PLAIN_EMAIL: Set to 1 to send plain text only (no HTML part)
 
     Raises:
         RuntimeError: If sendmail fails
@@ -175,21 +199,20 @@ def send_email(
             hostname = socket.gethostname()
             sender = f"{os.getenv('USER', 'user')}@{hostname}"
 
-    # Create MIME message
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = f"[YT Transcribe] {subject}"
-    msg["From"] = sender
-    msg["To"] = recipient
-
     # Plain text version (strip markdown formatting loosely)
     plain_text = markdown_content
 
-    # HTML version
-    html_content = markdown_to_html(markdown_content)
+    # Create MIME message: plain + HTML alternatives, or plain text only
+    if _wants_html(recipient):
+        msg = MIMEMultipart("alternative")
+        msg.attach(MIMEText(plain_text, "plain"))
+        msg.attach(MIMEText(markdown_to_html(markdown_content), "html"))
+    else:
+        msg = MIMEText(plain_text, "plain")
 
-    # Attach both versions
-    msg.attach(MIMEText(plain_text, "plain"))
-    msg.attach(MIMEText(html_content, "html"))
+    msg["Subject"] = f"[YT Transcribe] {subject}"
+    msg["From"] = sender
+    msg["To"] = recipient
 
     # Send via local sendmail-compatible MTA
     try:
@@ -197,17 +220,15 @@ def send_email(
         if not os.path.exists(sendmail_path):
             raise RuntimeError("sendmail not found on PATH or at /usr/sbin/sendmail")
 
-        process = subprocess.Popen(
+        result = subprocess.run(
             [sendmail_path, "-t", "-oi"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            input=msg.as_bytes(),
+            capture_output=True,
+            check=False,
         )
 
-        stdout, stderr = process.communicate(msg.as_bytes())
-
-        if process.returncode != 0:
-            raise RuntimeError(f"sendmail failed with code {process.returncode}: {stderr.decode()}")
+        if result.returncode != 0:
+            raise RuntimeError(f"sendmail failed with code {result.returncode}: {result.stderr.decode()}")
 
     except Exception as e:
         raise RuntimeError(f"Failed to send email: {e}") from e
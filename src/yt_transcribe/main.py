@@ -4,42 +4,78 @@
 import hashlib
 import json
 import os
-import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
 import click
-import yt_dlp
 
 from .config import (
     SUMMARIZATION_PROMPT,
-    TELEGRAM_CHAR_LIMIT,
     WHISPER_MODEL,
     check_platform,
 )
-from .email_sender import send_email
-from .codex_summarizer import summarize_with_codex
-from .telegram_sender import send_to_telegram
-from .privatebin_uploader import upload_transcript
+
+# Heavy dependencies (yt_dlp, reportlab, telegram, markdown, privatebinapi)
+# are imported inside the step that needs them, so --help and resumed runs
+# only pay for what they actually execute.
 
 
 class StateManager:
-    """Manages state and resumption for transcription workflow."""
+    """Manages state and resumption for transcription workflow.
+
+    Step completion is tracked in a single state.json ({step: completed_at}),
+    loaded once and rewritten atomically whenever a step changes.
+    """
+
+    STATE_FILE = "state.json"
 
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._steps = self._load_steps()
+
+    def _load_steps(self) -> dict:
+        """Load step completion times from state.json."""
+        try:
+            return json.loads((self.state_dir / self.STATE_FILE).read_bytes())
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            click.echo(f"Warning: Ignoring corrupt {self.STATE_FILE}", err=True)
+            return {}
+
+        # State directories from older versions use {step}.done marker files
+        return {marker.stem: marker.stat().st_mtime for marker in self.state_dir.glob("*.done")}
+
+    def _save_steps(self):
+        """Atomically write step completion times to state.json."""
+        path = self.state_dir / self.STATE_FILE
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(json.dumps(self._steps, indent=2).encode("utf-8"))
+        os.replace(tmp_path, path)
 
     def mark_complete(self, step: str):
         """Mark a step as complete."""
-        (self.state_dir / f"{step}.done").touch()
+        with self._lock:
+            self._steps[step] = time.time()
+            self._save_steps()
         click.echo(f"✓ Step completed: {step}")
 
+    def mark_incomplete(self, step: str):
+        """Clear a step's completion so it runs again."""
+        with self._lock:
+            if self._steps.pop(step, None) is not None:
+                self._save_steps()
+
     def is_complete(self, step: str) -> bool:
         """Check if a step is complete."""
-        return (self.state_dir / f"{step}.done").exists()
+        return step in self._steps
 
     def get_status(self, step: str) -> str:
         """Get status string for a step."""
@@ -56,9 +92,9 @@ class StateManager:
 
     def save_json(self, filename: str, data: dict):
         """Save JSON data to state directory."""
+        # Encode up front so large payloads (yt-dlp info) go out in one write
         path = self.state_dir / filename
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        path.write_bytes(json.dumps(data, indent=2).encode("utf-8"))
 
     def load_json(self, filename: str) -> dict:
         """Load JSON data from state directory."""
@@ -85,8 +121,19 @@ class StateManager:
 
 def get_state_dir(url: str) -> Path:
     """Get state directory for given URL."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    return Path("/tmp") / url_hash
+    url_bytes = url.encode("utf-8")
+    state_dir = Path("/tmp") / hashlib.blake2b(url_bytes, digest_size=16).hexdigest()
+
+    # Adopt a state directory created by older versions (MD5-named)
+    if not state_dir.exists():
+        legacy_dir = Path("/tmp") / hashlib.md5(url_bytes, usedforsecurity=False).hexdigest()
+        if legacy_dir.is_dir():
+            try:
+                legacy_dir.rename(state_dir)
+            except OSError:
+                return legacy_dir
+
+    return state_dir
 
 
 def get_video_info(url: str, state: StateManager, upgrade: bool = False) -> dict:
@@ -97,6 +144,8 @@ def get_video_info(url: str, state: StateManager, upgrade: bool = False) -> dict
 
     click.echo("Getting video info...")
 
+    import yt_dlp
+
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
@@ -124,11 +173,15 @@ def download_audio(url: str, state: StateManager, video_id: str, upgrade: bool =
     """Step 2: Download audio from video."""
     if state.is_complete("download"):
         click.echo("Using existing audio file...")
-        audio_filename = state.load_text("audio_filename.txt").strip()
+        # Audio is always downloaded into the state directory; resolve the saved
+        # name against it so a directory adopted from its legacy MD5 name
+        # still finds the file its old absolute path pointed to.
+        saved_filename = state.load_text("audio_filename.txt").strip()
+        audio_filename = str(state.state_dir / Path(saved_filename).name)
 
         if not os.path.exists(audio_filename):
             click.echo(f"Error: Audio file {audio_filename} not found, removing download marker", err=True)
-            os.remove(state.state_dir / "download.done")
+            state.mark_incomplete("download")
             click.echo("Re-run to download audio again")
             sys.exit(1)
 
@@ -137,6 +190,8 @@ def download_audio(url: str, state: StateManager, video_id: str, upgrade: bool =
 
     click.echo("Downloading audio...")
 
+    import yt_dlp
+
     output_template = str(state.state_dir / "%(id)s.%(ext)s")
 
     ydl_opts = {
@@ -154,13 +209,18 @@ def download_audio(url: str, state: StateManager, video_id: str, upgrade: bool =
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             ydl.download([url])
 
-        # Find the downloaded file
-        audio_files = list(state.state_dir.glob(f"{video_id}.*"))
-        if not audio_files:
-            click.echo("Error: Could not find downloaded audio file", err=True)
-            sys.exit(1)
+        # The opus postprocessor makes the output name predictable; only scan
+        # the state directory if it ended up somewhere else.
+        expected_audio = state.state_dir / f"{video_id}.opus"
+        if expected_audio.exists():
+            audio_filename = str(expected_audio)
+        else:
+            audio_files = list(state.state_dir.glob(f"{video_id}.*"))
+            if not audio_files:
+                click.echo("Error: Could not find downloaded audio file", err=True)
+                sys.exit(1)
+            audio_filename = str(audio_files[0])
 
-        audio_filename = str(audio_files[0])
         click.echo(f"Audio extracted to: {audio_filename}")
 
         # Save filename for resume
@@ -184,7 +244,7 @@ def transcribe_audio(audio_filename: str, state: StateManager, video_id: str, up
 
         if not os.path.exists(txt_filename):
             click.echo(f"Error: Transcription file {txt_filename} not found, removing transcribe marker", err=True)
-            os.remove(state.state_dir / "transcribe.done")
+            state.mark_incomplete("transcribe")
             click.echo("Re-run to transcribe again")
             sys.exit(1)
 
@@ -224,7 +284,6 @@ def transcribe_audio(audio_filename: str, state: StateManager, video_id: str, up
 
 
 def summarize_transcription(
-    transcription: str,
     title: str,
     webpage_url: str,
     state: StateManager,
@@ -238,7 +297,7 @@ def summarize_transcription(
 
         if not os.path.exists(md_filename):
             click.echo(f"Error: Summary file {md_filename} not found, removing summarize marker", err=True)
-            os.remove(state.state_dir / "summarize.done")
+            state.mark_incomplete("summarize")
             click.echo("Re-run to summarize again")
             sys.exit(1)
 
@@ -248,11 +307,14 @@ def summarize_transcription(
 
     click.echo("Summarizing with Codex CLI...")
 
+    from .codex_summarizer import summarize_with_codex
+
     # Create summary header
     summary_header = f"URL: {webpage_url}\nTitle: {title}\n\n"
 
-    # Get summary from Codex
-    summary_content = summarize_with_codex(transcription, SUMMARIZATION_PROMPT, state.state_dir)
+    # Get summary from Codex, streaming the transcript written by step 3
+    txt_path = state.state_dir / f"{video_id}.txt"
+    summary_content = summarize_with_codex(txt_path, SUMMARIZATION_PROMPT, state.state_dir)
 
     # Combine header and summary
     full_summary = summary_header + summary_content
@@ -280,6 +342,8 @@ def upload_full_transcript(
     click.echo("Uploading full transcript to PrivateBin...")
 
     try:
+        from .privatebin_uploader import upload_transcript
+
         privatebin_url = upload_transcript(transcription, title, webpage_url)
         click.echo(f"Full transcript uploaded: {privatebin_url}")
 
@@ -293,6 +357,34 @@ def upload_full_transcript(
         return None
 
 
+def _send_email_notification(summary: str, title: str):
+    """Send the summary by email."""
+    from .email_sender import send_email
+
+    send_email(summary, title)
+
+
+def _send_telegram_notification(summary: str, md_filename: str, title: str):
+    """Send the summary to Telegram (text or PDF based on length)."""
+    from .telegram_sender import send_to_telegram
+
+    send_to_telegram(summary, md_filename, title)
+
+
+def _send_desktop_notification(md_filename: str):
+    """Show a macOS terminal notification linking to the summary file."""
+    try:
+        subprocess.run([
+            "terminal-notifier",
+            "-title", "YT Transcribe",
+            "-message", "Transcription complete",
+            "-sound", "Glass",
+            "-open", f"file:///{md_filename}"
+        ], check=False)
+    except FileNotFoundError:
+        pass  # terminal-notifier not installed
+
+
 def send_notifications(
     summary: str,
     md_filename: str,
@@ -315,31 +407,29 @@ def send_notifications(
     if webpage_url:
         notification_summary += f"\n**Source:** {webpage_url}"
 
-    # Send email
-    try:
-        send_email(notification_summary, title)
-        click.echo("✓ Email sent")
-    except Exception as e:
-        click.echo(f"Warning: Email failed: {e}", err=True)
+    # (label, sender, args, report success) for each notification channel
+    notifiers = [
+        ("Email", _send_email_notification, (notification_summary, title), True),
+        ("Telegram", _send_telegram_notification, (notification_summary, md_filename, title), True),
+        ("Terminal notification", _send_desktop_notification, (md_filename,), False),
+    ]
 
-    # Send to Telegram (text or PDF based on length)
-    try:
-        send_to_telegram(notification_summary, md_filename, title)
-        click.echo("✓ Telegram sent")
-    except Exception as e:
-        click.echo(f"Warning: Telegram failed: {e}", err=True)
-
-    # macOS terminal notification
-    try:
-        subprocess.run([
-            "terminal-notifier",
-            "-title", "YT Transcribe",
-            "-message", "Transcription complete",
-            "-sound", "Glass",
-            "-open", f"file:///{md_filename}"
-        ], check=False)
-    except FileNotFoundError:
-        pass  # terminal-notifier not installed
+    # Channels are independent and I/O bound, so deliver them concurrently;
+    # a failure in one channel is reported without affecting the others.
+    with ThreadPoolExecutor(max_workers=len(notifiers)) as executor:
+        futures = {
+            executor.submit(sender, *args): (label, report)
+            for label, sender, args, report in notifiers
+        }
+        for future in as_completed(futures):
+            label, report = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                click.echo(f"Warning: {label} failed: {e}", err=True)
+            else:
+                if report:
+                    click.echo(f"✓ {label} sent")
 
     state.mark_complete("notify")
 
@@ -392,15 +482,25 @@ def cli(url: str, upgrade: bool, resume: bool):
     # Step 3: Transcribe
     transcription = transcribe_audio(audio_filename, state, video_id, upgrade)
 
-    # Step 4: Summarize
-    summary = summarize_transcription(transcription, title, webpage_url, state, video_id)
-
-    md_filename = str(state.state_dir / f"{video_id}.md")
-    full_path = os.path.realpath(md_filename)
-    click.echo(f"Summary saved to {full_path}")
-
-    # Step 5: Upload full transcript to PrivateBin
-    privatebin_url = upload_full_transcript(transcription, title, webpage_url, state)
+    # Steps 4 & 5: Summarize while the full transcript uploads to PrivateBin
+    # (independent network-bound steps, so run them concurrently)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        upload_future = None
+        if not state.is_complete("upload"):
+            upload_future = executor.submit(
+                upload_full_transcript, transcription, title, webpage_url, state
+            )
+
+        summary = summarize_transcription(title, webpage_url, state, video_id)
+
+        md_filename = str(state.state_dir / f"{video_id}.md")
+        full_path = os.path.realpath(md_filename)
+        click.echo(f"Summary saved to {full_path}")
+
+        if upload_future is not None:
+            privatebin_url = upload_future.result()
+        else:
+            privatebin_url = upload_full_transcript(transcription, title, webpage_url, state)
 
     # Step 6: Send notifications
     send_notifications(summary, full_path, state, title, privatebin_url, webpage_url)
@@ -1,39 +1,126 @@
 """Telegram sender with PDF support for long messages."""
 
 import asyncio
+import functools
 import html
-import os
+import io
 import re
-import tempfile
-from pathlib import Path
-from typing import Optional
-
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import (
-    PageBreak,
-    Paragraph,
-    SimpleDocTemplate,
-    Spacer,
-)
+import threading
+from typing import BinaryIO, Optional, Union
+
 from telegram import Bot
 from telegram.constants import ParseMode
 
 from .config import TELEGRAM_CHAR_LIMIT, get_telegram_chat_id, get_telegram_token
 
+# reportlab is only imported when a PDF is actually built (long summaries),
+# so the plain-message path never pays for loading it.
+
+# Inline markdown patterns, compiled once at import
+_BOLD_ANY = re.compile(r'\*\*(.+?)\*\*|__(.+?)__')
+
+# Bold, italic and links in a single pattern so each line is scanned once.
+# Bold alternatives come first so '**' is never read as two italic markers.
+_INLINE = re.compile(
+    r'\*\*(?P<bs>.+?)\*\*'
+    r'|__(?P<bu>.+?)__'
+    r'|\*(?P<is>.+?)\*'
+    r'|_(?P<iu>.+?)_'
+    r'|\[(?P<lt>.+?)\]\((?P<lu>.+?)\)'
+)
+
+# Heading marker -> (style name, spacer after the heading)
+_HEADINGS = {
+    '#': ('h1', 'large'),
+    '##': ('h2', 'medium'),
+    '###': ('h3', 'small'),
+}
+
+
+def _inline_markup_repl(match: re.Match[str]) -> str:
+    """Render one inline markdown match as reportlab paragraph markup."""
+    kind = match.lastgroup
+    if kind == 'lu':
+        href = match.group('lu').replace('"', '&quot;')
+        return f'<a href="{href}">{_inline_markup(match.group("lt"))}</a>'
+    inner = _inline_markup(match.group(kind))
+    if kind in ('bs', 'bu'):
+        return f'<b>{inner}</b>'
+    return f'<i>{inner}</i>'
+
+
+def _inline_markup(text: str) -> str:
+    """Convert inline markdown (bold, italic, links) to reportlab markup."""
+    # Most transcript prose has no markup; skip the regex scan entirely
+    if '*' not in text and '_' not in text and '[' not in text:
+        return text
+    return _INLINE.sub(_inline_markup_repl, text)
+
+
+@functools.cache
+def _pdf_styles() -> dict:
+    """Build the PDF paragraph styles once; they are not mutated after creation."""
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 
-def markdown_to_pdf(markdown_content: str, output_path: str, title: str):
+    styles = getSampleStyleSheet()
+
+    return {
+        # Custom heading styles
+        'h1': ParagraphStyle(
+            'CustomH1',
+            parent=styles['Heading1'],
+            fontSize=16,
+            textColor='#1a1a1a',
+            spaceAfter=12,
+        ),
+        'h2': ParagraphStyle(
+            'CustomH2',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor='#333333',
+            spaceAfter=10,
+        ),
+        'h3': ParagraphStyle(
+            'CustomH3',
+            parent=styles['Heading3'],
+            fontSize=12,
+            textColor='#333333',
+            spaceAfter=8,
+        ),
+        # Body text style
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['BodyText'],
+            fontSize=11,
+            leading=16,
+            textColor='#333333',
+        ),
+    }
+
+
+# Spacer heights in points (1 inch = 72). Only the heights are shared: reportlab
+# keeps per-build layout state on each flowable, so Spacers are built per use.
+_SPACER_HEIGHTS = {
+    'small': 0.1 * 72,
+    'medium': 0.15 * 72,
+    'large': 0.2 * 72,
+}
+
+
+def markdown_to_pdf(markdown_content: str, output: Union[str, BinaryIO], title: str):
     """
     Convert markdown to PDF using reportlab.
 
     Args:
         markdown_content: Markdown text
-        output_path: Path to save PDF
+        output: Path or binary file object to write the PDF to
         title: Document title
     """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     doc = SimpleDocTemplate(
-        output_path,
+        output,
         pagesize=letter,
         rightMargin=72,
         leftMargin=72,
@@ -41,113 +128,80 @@ def markdown_to_pdf(markdown_content: str, output_path: str, title: str):
         bottomMargin=18,
     )
 
-    # Container for the 'Flowable' objects
+    # Container for the 'Flowable' objects (append bound once for the loop)
     elements = []
+    add = elements.append
 
-    # Define styles
-    styles = getSampleStyleSheet()
-
-    # Custom title style
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor='#1a1a1a',
-        spaceAfter=30,
-    )
-
-    # Custom heading styles
-    h1_style = ParagraphStyle(
-        'CustomH1',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor='#1a1a1a',
-        spaceAfter=12,
-    )
-
-    h2_style = ParagraphStyle(
-        'CustomH2',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor='#333333',
-        spaceAfter=10,
-    )
-
-    h3_style = ParagraphStyle(
-        'CustomH3',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor='#333333',
-        spaceAfter=8,
-    )
-
-    # Body text style
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=11,
-        leading=16,
-        textColor='#333333',
-    )
+    # Shared styles
+    styles = _pdf_styles()
+    blank_height = _SPACER_HEIGHTS['small']
+    body_style = styles['body']
 
     # Parse markdown line by line
-    lines = markdown_content.split('\n')
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].strip()
+    for line in markdown_content.splitlines():
+        line = line.strip()
 
         if not line:
-            elements.append(Spacer(1, 0.1 * inch))
-            i += 1
+            add(Spacer(1, blank_height))
             continue
 
-        # Headers
-        if line.startswith('# '):
-            text = line[2:].strip()
-            elements.append(Paragraph(text, h1_style))
-            elements.append(Spacer(1, 0.2 * inch))
-        elif line.startswith('## '):
-            text = line[3:].strip()
-            elements.append(Paragraph(text, h2_style))
-            elements.append(Spacer(1, 0.15 * inch))
-        elif line.startswith('### '):
-            text = line[4:].strip()
-            elements.append(Paragraph(text, h3_style))
-            elements.append(Spacer(1, 0.1 * inch))
+        # Dispatch on the first character; most lines are plain paragraphs
+        first = line[0]
+        heading = None
+        if first == '#':
+            marker, sep, text = line.partition(' ')
+            if sep:
+                heading = _HEADINGS.get(marker)
+
+        # Source text is escaped before any markup is added, so a stray '&'
+        # or '<' in the transcript is rendered literally rather than being
+        # parsed (and mangled) as reportlab markup.
+
+        # Headers (line is already stripped, so only leading space remains)
+        if heading is not None:
+            style_name, spacer_name = heading
+            text = html.escape(text.lstrip(), quote=False)
+            elements.extend((
+                Paragraph(text, styles[style_name]),
+                Spacer(1, _SPACER_HEIGHTS[spacer_name]),
+            ))
         # Bullet points
-        elif line.startswith('- ') or line.startswith('* '):
-            text = line[2:].strip()
-            # Handle bold
-            text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-            text = re.sub(r'__(.+?)__', r'<b>\1</b>', text)
-            # Handle italic
-            text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-            text = re.sub(r'_(.+?)_', r'<i>\1</i>', text)
-            # Handle links
-            text = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', text)
-
-            elements.append(Paragraph(f'• {text}', body_style))
+        elif first in '-*' and line[1:2] == ' ':
+            text = _inline_markup(html.escape(line[2:].lstrip(), quote=False))
+            add(Paragraph(f'• {text}', body_style))
         # Regular paragraph
         else:
-            text = line
-            # Handle bold
-            text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-            text = re.sub(r'__(.+?)__', r'<b>\1</b>', text)
-            # Handle italic
-            text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-            text = re.sub(r'_(.+?)_', r'<i>\1</i>', text)
-            # Handle links
-            text = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', text)
-
-            elements.append(Paragraph(text, body_style))
-
-        i += 1
+            add(Paragraph(_inline_markup(html.escape(line, quote=False)), body_style))
 
     # Build PDF
     doc.build(elements)
 
 
+# Sends run on one long-lived event loop so cached Bot instances (and their
+# HTTP connection pools) stay bound to the loop they were created on.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the sender's event loop, starting it on a daemon thread if needed."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="telegram-sender", daemon=True
+            ).start()
+            _loop = loop
+    return _loop
+
+
+@functools.lru_cache(maxsize=4)
+def _get_bot(bot_token: str) -> Bot:
+    """Return a Bot for this token, reusing its connection pool across sends."""
+    return Bot(token=bot_token)
+
+
 async def _send_to_telegram_async(
     markdown_content: str,
     source_file: str,
@@ -165,7 +219,7 @@ async def _send_to_telegram_async(
         bot_token: Telegram bot token
         chat_id: Telegram chat ID
     """
-    bot = Bot(token=bot_token)
+    bot = _get_bot(bot_token)
 
     formatted_text = format_markdown_for_telegram(markdown_content)
 
@@ -179,25 +233,17 @@ async def _send_to_telegram_async(
             disable_web_page_preview=False
         )
     else:
-        # Content too long - convert to PDF and send as document
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            pdf_path = tmp.name
-
-        try:
-            markdown_to_pdf(markdown_content, pdf_path, title)
-
-            # Send PDF document
-            with open(pdf_path, "rb") as pdf_file:
-                await bot.send_document(
-                    chat_id=chat_id,
-                    document=pdf_file,
-                    filename=f"{title[:50]}.pdf",  # Limit filename length
-                    caption=f"Summary too long for message ({len(markdown_content)} chars), sent as PDF"
-                )
-        finally:
-            # Clean up temp file
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
+        # Content too long - convert to PDF (in memory) and send as document
+        pdf_buffer = io.BytesIO()
+        markdown_to_pdf(markdown_content, pdf_buffer, title)
+        pdf_buffer.seek(0)
+
+        await bot.send_document(
+            chat_id=chat_id,
+            document=pdf_buffer,
+            filename=f"{title[:50]}.pdf",  # Limit filename length
+            caption=f"Summary too long for message ({len(markdown_content)} chars), sent as PDF"
+        )
 
 
 def send_to_telegram(
@@ -240,60 +286,53 @@ def send_to_telegram(
             raise RuntimeError("Telegram chat ID not configured (set in ~/.config/yt-transcribe/config.toml or TELEGRAM_CHAT_ID env var)")
 
     try:
-        asyncio.run(_send_to_telegram_async(
+        future = asyncio.run_coroutine_threadsafe(_send_to_telegram_async(
             markdown_content=markdown_content,
             source_file=source_file,
             title=title,
             bot_token=bot_token,
             chat_id=chat_id
-        ))
+        ), _get_event_loop())
+        future.result()
     except Exception as e:
         raise RuntimeError(f"Failed to send to Telegram: {e}") from e
 
 
 def format_markdown_for_telegram(markdown_content: str) -> str:
     """Convert basic markdown to Telegram-compatible HTML."""
-    lines = markdown_content.splitlines()
     formatted_lines = []
+    add = formatted_lines.append
 
-    for line in lines:
+    for line in markdown_content.splitlines():
         stripped = line.strip()
         if not stripped:
-            formatted_lines.append("")
+            add("")
             continue
 
-        if stripped.startswith("#"):
+        first = stripped[0]
+        if first == "#":
             heading_text = stripped.lstrip("#").strip()
-            formatted_lines.append(f"<b>{html.escape(heading_text)}</b>")
-            continue
-
-        bullet_match = re.match(r"^[-*]\s+(.*)$", stripped)
-        if bullet_match:
-            content = bullet_match.group(1)
-            formatted_lines.append(f"- {_format_inline_html(content)}")
-            continue
-
-        formatted_lines.append(_format_inline_html(stripped))
+            add(f"<b>{html.escape(heading_text, quote=False)}</b>")
+        elif first in "-*" and stripped[1:2].isspace():
+            # Bullet: marker, whitespace, then the item text
+            add(f"- {_format_inline_html(stripped[2:].lstrip())}")
+        else:
+            add(_format_inline_html(stripped))
 
     return "\n".join(formatted_lines)
 
 
 def _format_inline_html(text: str) -> str:
     """Format bold markdown segments into Telegram HTML."""
-    bold_segments: list[str] = []
-
-    def replace_bold(match: re.Match[str]) -> str:
-        content = match.group(1) or match.group(2)
-        bold_segments.append(content)
-        return f"CODEXBOLDTOKEN{len(bold_segments) - 1}"
-
-    text = re.sub(r"\*\*(.+?)\*\*", replace_bold, text)
-    text = re.sub(r"__(.+?)__", replace_bold, text)
-
-    escaped = html.escape(text)
-    for idx, content in enumerate(bold_segments):
-        token = f"CODEXBOLDTOKEN{idx}"
-        bold_text = html.escape(content)
-        escaped = escaped.replace(token, f"<b>{bold_text}</b>")
-
-    return escaped
+    # Escape the text between bold spans and the bold content separately,
+    # emitting tags as we go, so no placeholder substitution is needed.
+    # This is element text, never an attribute value, so quotes stay as-is.
+    parts: list[str] = []
+    pos = 0
+    for match in _BOLD_ANY.finditer(text):
+        parts.append(html.escape(text[pos:match.start()], quote=False))
+        parts.append(f"<b>{html.escape(match.group(1) or match.group(2), quote=False)}</b>")
+        pos = match.end()
+    parts.append(html.escape(text[pos:], quote=False))
+
+    return "".join(parts)